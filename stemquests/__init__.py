@@ -1,8 +1,22 @@
 
-import requests
+from typing import TYPE_CHECKING
 
-from .check_tor import check_tor
-from .tor_instance import TorConnectionError, TorInstance
+from .check_tor import check_tor, check_tor_async, check_tor_html
 
-# Disable warnings for requests
-requests.packages.urllib3.disable_warnings() # pylint: disable=no-member
+if TYPE_CHECKING:
+    from .tor_instance import TorConnectionError, TorInstance
+
+__all__ = ["check_tor", "check_tor_async", "check_tor_html", "TorConnectionError", "TorInstance"]
+
+
+def __getattr__(name: str):
+    """Import TorInstance and TorConnectionError on first use (PEP 562), deferring the cost of importing tor_instance."""
+    if name in ("TorConnectionError", "TorInstance"):
+        from . import tor_instance # pylint: disable=import-outside-toplevel
+        return getattr(tor_instance, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """List the lazily imported names alongside the module's globals."""
+    return sorted(set(globals()) | set(__all__))
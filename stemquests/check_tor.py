@@ -1,7 +1,9 @@
 """Helper function to check if Tor is working.
 
-Uses a request session to HTTP GET check.torproject.org,
-checks if the response contains the string "Congratulations. This browser is configured to use Tor.".
+Uses a request session to HTTP GET check.torproject.org/api/ip,
+checks if the JSON response reports "IsTor" as true.
+If the API does not return JSON, falls back to streaming the check.torproject.org page
+until it finds the string "Congratulations. This browser is configured to use Tor.".
 
 Usage:
 tor = TorInstance()
@@ -9,19 +11,126 @@ session = tor.create_requests_session()
 if not check_tor(session):
     print("Tor is not working.")
     sys.exit(1)
+
+check_tor_async() does the same with an aiohttp.ClientSession, allowing many checks to run concurrently.
+Requires the "async" extra (aiohttp and aiohttp-socks).
 """
 
-import requests
+from typing import TYPE_CHECKING, Tuple
+
+if TYPE_CHECKING:
+    import aiohttp
+    import requests
+
+_URL = "https://check.torproject.org/api/ip"
+_HTML_URL = "https://check.torproject.org"
+# Arguments for every check request, the timeout stops a hung Tor connection from blocking the check forever
+# Certificate verification is left to the session, so a custom CA bundle set on it still applies
+_GET_KW = {"timeout": 15, "allow_redirects": False}
+# Matched against the raw response bytes, skipping charset detection and decoding of the page
+_TOR_OK = b"Congratulations. This browser is configured to use Tor."
+
 
+def _find_tor_ok(tail: bytes, chunk: bytes) -> Tuple[bool, bytes]:
+    """Look for _TOR_OK in the next chunk of the check page.
 
-def check_tor(session: requests.Session) -> bool:
+    Args:
+        tail (bytes): The end of the previous chunks, in case the message is split between chunks.
+        chunk (bytes): The next chunk of the page.
+
+    Returns:
+        bool: True if the message was found, False otherwise.
+        bytes: The tail to pass with the following chunk.
+    """
+    window = tail + chunk
+    return _TOR_OK in window, window[-(len(_TOR_OK) - 1):]
+
+
+def check_tor(session: "requests.Session") -> bool:
     """Check if Tor is working.
 
     Args:
         session (requests.Session): Requests session to check.
 
     Returns:
-        bool: True if Tor is working, False otherwise.
+        bool: True if Tor is working, False otherwise (including if the check times out or fails to connect).
+    """
+    # Imported here, only for its exceptions, so importing stemquests does not import requests
+    import requests # pylint: disable=import-outside-toplevel, redefined-outer-name
+
+    try:
+        # stream=False reads the body up front, releasing the keep-alive connection back to the session's pool
+        tor_check = session.get(_URL, stream=False, **_GET_KW)
+        api_result = tor_check.json()
+    except (requests.Timeout, requests.ConnectionError, requests.exceptions.ChunkedEncodingError):
+        return False
+    except ValueError:
+        return check_tor_html(session)
+    # Valid JSON that is not an object is not the API's answer, check the page instead
+    if not isinstance(api_result, dict):
+        return check_tor_html(session)
+    return api_result.get("IsTor") is True
+
+
+def check_tor_html(session: "requests.Session") -> bool:
+    """Check if Tor is working using the check.torproject.org page.
+
+    The page is streamed and the response closed as soon as the success message is found.
+
+    Args:
+        session (requests.Session): Requests session to check.
+
+    Returns:
+        bool: True if Tor is working, False otherwise (including if the check times out or fails to connect).
     """
-    with session.get("https://check.torproject.org") as tor_check:
-        return "Congratulations. This browser is configured to use Tor." in tor_check.text
+    import requests # pylint: disable=import-outside-toplevel, redefined-outer-name
+
+    try:
+        with session.get(_HTML_URL, stream=True, **_GET_KW) as tor_check:
+            tail = b""
+            for chunk in tor_check.iter_content(4096):
+                found, tail = _find_tor_ok(tail, chunk)
+                if found:
+                    return True
+    except (requests.Timeout, requests.ConnectionError, requests.exceptions.ChunkedEncodingError):
+        return False
+    return False
+
+
+async def check_tor_async(session: "aiohttp.ClientSession") -> bool:
+    """Check if Tor is working without blocking the event loop.
+
+    Args:
+        session (aiohttp.ClientSession): aiohttp session to check, connected through the Tor SOCKS proxy.
+
+    Returns:
+        bool: True if Tor is working, False otherwise (including if the check times out or fails to connect).
+    """
+    # Imported here so aiohttp is only required when using the async API, and asyncio is not imported with stemquests
+    import asyncio # pylint: disable=import-outside-toplevel
+
+    import aiohttp # pylint: disable=import-outside-toplevel, redefined-outer-name
+    from aiohttp_socks import ProxyConnectionError, ProxyError, ProxyTimeoutError # pylint: disable=import-outside-toplevel
+
+    get_kw = {"timeout": aiohttp.ClientTimeout(total=_GET_KW["timeout"]), "allow_redirects": _GET_KW["allow_redirects"]}
+    try:
+        async with session.get(_URL, **get_kw) as tor_check:
+            try:
+                # content_type=None accepts the API's JSON regardless of the Content-Type header it is served with
+                api_result = await tor_check.json(content_type=None)
+            except ValueError:
+                api_result = None
+        # Fall back to the page if the API did not answer with a JSON object
+        if isinstance(api_result, dict):
+            return api_result.get("IsTor") is True
+        # Stream the page and stop reading as soon as the message is found, like check_tor_html()
+        async with session.get(_HTML_URL, **get_kw) as tor_check:
+            tail = b""
+            async for chunk in tor_check.content.iter_chunked(4096):
+                found, tail = _find_tor_ok(tail, chunk)
+                if found:
+                    return True
+        return False
+    except (asyncio.TimeoutError, aiohttp.ClientError, ProxyError, ProxyConnectionError, ProxyTimeoutError):
+        # aiohttp_socks' proxy errors are not ClientErrors, they cover SOCKS failures such as an unbuilt circuit
+        return False